@@ -14,6 +14,8 @@ from skyvern.forge.sdk.api.llm.exceptions import EmptyLLMResponseError, InvalidL
 
 LOG = structlog.get_logger()
 
+_MARKDOWN_JSON_PATTERN = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+
 
 async def llm_messages_builder(
     prompt: str,
@@ -284,8 +286,7 @@ def _fix_and_parse_json_string(json_string: str) -> dict[str, Any]:
 
 
 def _try_to_extract_json_from_markdown_format(text: str) -> str:
-    pattern = r"```json\s*(.*?)\s*```"
-    match = re.search(pattern, text, re.DOTALL)
+    match = _MARKDOWN_JSON_PATTERN.search(text)
     if match:
         return match.group(1)
     else:
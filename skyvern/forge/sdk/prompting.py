@@ -25,7 +25,7 @@ from pathlib import Path
 from typing import Any, List
 
 import structlog
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 
 from skyvern.constants import SKYVERN_DIR
 
@@ -58,6 +58,9 @@ class PromptEngine:
             self.model = self.get_closest_match(self.model, model_names)
 
             self.env = Environment(loader=FileSystemLoader(models_dir))
+            # Environment.from_string compiles the template on every call, so keep our own cache
+            # for the string templates that get re-rendered with different arguments
+            self._string_template_cache: dict[str, Template] = {}
         except Exception:
             LOG.error("Error initializing PromptEngine.", model=model, exc_info=True)
             raise
@@ -122,7 +125,12 @@ class PromptEngine:
             str: The populated template.
         """
         try:
-            jinja_template = self.env.from_string(template)
+            jinja_template = self._string_template_cache.get(template)
+            if jinja_template is None:
+                jinja_template = self.env.from_string(template)
+                if len(self._string_template_cache) >= 256:
+                    self._string_template_cache.clear()
+                self._string_template_cache[template] = jinja_template
             return jinja_template.render(**kwargs)
         except Exception:
             LOG.error(
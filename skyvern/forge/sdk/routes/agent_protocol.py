@@ -89,6 +89,12 @@ from skyvern.webeye.actions.actions import Action
 
 LOG = structlog.get_logger()
 
+try:
+    # use the libyaml C extension when it's available; it parses large workflow definitions much faster
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 
 class AISuggestionType(str, Enum):
     DATA_SCHEMA = "data_schema"
@@ -445,7 +451,7 @@ async def create_workflow_legacy(
     analytics.capture("skyvern-oss-agent-workflow-create-legacy")
     raw_yaml = await request.body()
     try:
-        workflow_yaml = yaml.safe_load(raw_yaml)
+        workflow_yaml = yaml.load(raw_yaml, Loader=YamlSafeLoader)
     except yaml.YAMLError:
         raise HTTPException(status_code=422, detail="Invalid YAML")
 
@@ -496,7 +502,7 @@ async def create_workflow(
     analytics.capture("skyvern-oss-agent-workflow-create")
     try:
         if data.yaml_definition:
-            workflow_json_from_yaml = yaml.safe_load(data.yaml_definition)
+            workflow_json_from_yaml = yaml.load(data.yaml_definition, Loader=YamlSafeLoader)
             workflow_definition = WorkflowCreateYAMLRequest.model_validate(workflow_json_from_yaml)
         elif data.json_definition:
             workflow_definition = data.json_definition
@@ -553,7 +559,7 @@ async def update_workflow_legacy(
     # validate the workflow
     raw_yaml = await request.body()
     try:
-        workflow_yaml = yaml.safe_load(raw_yaml)
+        workflow_yaml = yaml.load(raw_yaml, Loader=YamlSafeLoader)
     except yaml.YAMLError:
         raise HTTPException(status_code=422, detail="Invalid YAML")
 
@@ -619,7 +625,7 @@ async def update_workflow(
     analytics.capture("skyvern-oss-agent-workflow-update")
     try:
         if data.yaml_definition:
-            workflow_json_from_yaml = yaml.safe_load(data.yaml_definition)
+            workflow_json_from_yaml = yaml.load(data.yaml_definition, Loader=YamlSafeLoader)
             workflow_definition = WorkflowCreateYAMLRequest.model_validate(workflow_json_from_yaml)
         elif data.json_definition:
             workflow_definition = data.json_definition
@@ -1303,14 +1309,15 @@ async def get_workflow_runs(
     page_size: int = Query(10, ge=1),
     status: Annotated[list[WorkflowRunStatus] | None, Query()] = None,
     current_org: Organization = Depends(org_auth_service.get_current_org),
-) -> list[WorkflowRun]:
+) -> Response:
     analytics.capture("skyvern-oss-agent-workflow-runs-get")
-    return await app.WORKFLOW_SERVICE.get_workflow_runs(
+    workflow_runs = await app.WORKFLOW_SERVICE.get_workflow_runs(
         organization_id=current_org.organization_id,
         page=page,
         page_size=page_size,
         status=status,
     )
+    return ORJSONResponse([workflow_run.model_dump() for workflow_run in workflow_runs])
 
 
 @legacy_base_router.get(
@@ -1333,15 +1340,16 @@ async def get_workflow_runs_by_id(
     page_size: int = Query(10, ge=1),
     status: Annotated[list[WorkflowRunStatus] | None, Query()] = None,
     current_org: Organization = Depends(org_auth_service.get_current_org),
-) -> list[WorkflowRun]:
+) -> Response:
     analytics.capture("skyvern-oss-agent-workflow-runs-get")
-    return await app.WORKFLOW_SERVICE.get_workflow_runs_for_workflow_permanent_id(
+    workflow_runs = await app.WORKFLOW_SERVICE.get_workflow_runs_for_workflow_permanent_id(
         workflow_permanent_id=workflow_id,
         organization_id=current_org.organization_id,
         page=page,
         page_size=page_size,
         status=status,
     )
+    return ORJSONResponse([workflow_run.model_dump() for workflow_run in workflow_runs])
 
 
 @legacy_base_router.get(
@@ -34,10 +34,16 @@ def resize_screenshots(screenshots: list[bytes], target_dimension: Resolution) -
     https://github.com/anthropics/anthropic-quickstarts/blob/81c4085944abb1734db411f05290b538fdc46dcd/computer-use-demo/computer_use_demo/tools/computer.py#L49-L60
     """
     new_screenshots = []
+    target_size = (target_dimension["width"], target_dimension["height"])
     for screenshot in screenshots:
         # Convert bytes to PIL Image
         img = Image.open(io.BytesIO(screenshot))
 
+        # Already at the target dimension: skip the no-op resize and the PNG re-encode
+        if img.size == target_size:
+            new_screenshots.append(screenshot)
+            continue
+
         # Resize image to target dimensions
         resized_img = img.resize((target_dimension["width"], target_dimension["height"]), Image.Resampling.LANCZOS)
 
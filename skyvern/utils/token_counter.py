@@ -1,5 +1,12 @@
+from functools import lru_cache
+
 import tiktoken
 
 
+@lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    return tiktoken.encoding_for_model("gpt-4o")
+
+
 def count_tokens(text: str) -> int:
-    return len(tiktoken.encoding_for_model("gpt-4o").encode(text))
+    return len(_get_encoding().encode(text))
@@ -171,7 +171,7 @@ def check_existed_but_not_option_element_in_dom_factory(
             current_element = SkyvernElement(locator=locator, frame=frame, static_element=element_dict)
             if await current_element.is_custom_option():
                 return False
-            return await dom.check_id_in_dom(element_id)
+            return dom.check_id_in_dom(element_id)
         except Exception:
             LOG.debug(
                 "Failed to check if the element is a custom option, going to keep the element in the incremental tree",
@@ -1697,7 +1697,7 @@ async def handle_scroll_action(
 ) -> list[ActionResult]:
     if action.x and action.y:
         await page.mouse.move(action.x, action.y)
-    await page.evaluate(f"window.scrollBy({action.scroll_x}, {action.scroll_y})")
+    await page.evaluate("([x, y]) => window.scrollBy(x, y)", [action.scroll_x, action.scroll_y])
     return [ActionSuccess()]
 
 
@@ -2610,10 +2610,12 @@ async def select_from_emerging_elements(
     new_element_ids = set(scraped_page_after_open.id_to_css_dict.keys()) - set(scraped_page.id_to_css_dict.keys())
 
     dom_after_open = DomUtil(scraped_page=scraped_page_after_open, page=page)
+    # the interactable flag is static scrape output, so read it from the element dict
+    # instead of resolving a live locator for every new element
     new_interactable_element_ids = [
         element_id
         for element_id in new_element_ids
-        if (await dom_after_open.get_skyvern_element_by_id(element_id)).is_interactable()
+        if scraped_page_after_open.id_to_element_dict.get(element_id, {}).get("interactable", False)
     ]
 
     if len(new_interactable_element_ids) == 0:
@@ -1,4 +1,5 @@
-from typing import Any, Dict
+import re
+from typing import Any, Dict, Match
 
 import structlog
 from openai.types.responses.response import Response as OpenAIResponse
@@ -857,13 +858,21 @@ async def parse_ui_tars_actions(
         return []
 
 
+# compiled once at import so each UI-TARS response doesn't re-build the patterns
+_UI_TARS_THOUGHT_PATTERNS = (
+    re.compile(r"Thought: (.+?)(?=\s*Action: |$)", re.DOTALL),
+    re.compile(r"Reflection: (.+?)Action_Summary: (.+?)(?=\s*Action: |$)", re.DOTALL),
+    re.compile(r"Action_Summary: (.+?)(?=\s*Action: |$)", re.DOTALL),
+)
+_UI_TARS_TYPE_CONTENT_PATTERN = re.compile(r"type\(content='(.*?)'\)")
+_UI_TARS_POINT_PATTERN = re.compile(r"<point>(\d+)\s+(\d+)</point>")
+
+
 def _parse_ui_tars_response(response_content: str, browser_window_dimension: Resolution) -> list[dict[str, Any]]:
     """Parse UI-TARS response text into structured action data.
 
     Extracts essential parsing logic from action_parser.py without the complex coordinate transformations.
     """
-    import re
-
     text = response_content.strip()
 
     # Convert point format to coordinates if needed
@@ -877,14 +886,8 @@ def _parse_ui_tars_response(response_content: str, browser_window_dimension: Res
 
     # Extract thought/reasoning
     thought = None
-    thought_patterns = [
-        r"Thought: (.+?)(?=\s*Action: |$)",
-        r"Reflection: (.+?)Action_Summary: (.+?)(?=\s*Action: |$)",
-        r"Action_Summary: (.+?)(?=\s*Action: |$)",
-    ]
-
-    for pattern in thought_patterns:
-        thought_match = re.search(pattern, text, re.DOTALL)
+    for pattern in _UI_TARS_THOUGHT_PATTERNS:
+        thought_match = pattern.search(text)
         if thought_match:
             if len(thought_match.groups()) == 1:
                 thought = thought_match.group(1).strip()
@@ -912,8 +915,7 @@ def _parse_ui_tars_response(response_content: str, browser_window_dimension: Res
             if not action_part.endswith(")"):
                 action_part += ")"
             # Extract content from type action
-            pattern = r"type\(content='(.*?)'\)"
-            match = re.search(pattern, action_part)
+            match = _UI_TARS_TYPE_CONTENT_PATTERN.search(action_part)
             if match:
                 content = match.group(1)
                 # Escape single quotes in content
@@ -990,16 +992,12 @@ def _parse_single_action(action_str: str) -> dict[str, Any] | None:
 
 def _convert_point_to_coordinates(text: str) -> str:
     """Convert <point>x y</point> format to (x,y) format."""
-    import re
-    from typing import Match
-
-    pattern = r"<point>(\d+)\s+(\d+)</point>"
 
     def replace_match(match: Match[str]) -> str:
         x, y = map(int, match.groups())
         return f"({x},{y})"
 
-    return re.sub(pattern, replace_match, text)
+    return _UI_TARS_POINT_PATTERN.sub(replace_match, text)
 
 
 def _create_ui_tars_action(
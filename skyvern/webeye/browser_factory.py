@@ -12,6 +12,7 @@ import subprocess
 import time
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Awaitable, Callable, Protocol
 from urllib.parse import urlparse
@@ -134,6 +135,13 @@ def initialize_download_dir() -> str:
     return get_download_dir(context.workflow_run_id, context.task_id)
 
 
+@lru_cache(maxsize=1)
+def _load_chromium_preference_template(template_path: str, mtime: float) -> str:
+    # mtime is part of the cache key so an edited template is picked up without a restart
+    with open(template_path) as f:
+        return f.read()
+
+
 class BrowserContextCreator(Protocol):
     def __call__(
         self, playwright: Playwright, proxy_location: ProxyLocation | None = None, **kwargs: dict[str, Any]
@@ -161,11 +169,11 @@ class BrowserContextFactory:
         preference_dst_file = f"{preference_dst_folder}/Preferences"
         preference_template = f"{SKYVERN_DIR}/webeye/chromium_preferences.json"
 
-        preference_file_content = ""
-        with open(preference_template) as f:
-            preference_file_content = f.read()
-            preference_file_content = preference_file_content.replace("MASK_SAVEFILE_DEFAULT_DIRECTORY", download_dir)
-            preference_file_content = preference_file_content.replace("MASK_DOWNLOAD_DEFAULT_DIRECTORY", download_dir)
+        preference_file_content = _load_chromium_preference_template(
+            preference_template, os.path.getmtime(preference_template)
+        )
+        preference_file_content = preference_file_content.replace("MASK_SAVEFILE_DEFAULT_DIRECTORY", download_dir)
+        preference_file_content = preference_file_content.replace("MASK_DOWNLOAD_DEFAULT_DIRECTORY", download_dir)
         with open(preference_dst_file, "w") as f:
             f.write(preference_file_content)
 
@@ -192,7 +192,7 @@ def build_element_dict(
     id_to_element_dict: dict[str, dict] = {}
     id_to_frame_dict: dict[str, str] = {}
     id_to_element_hash: dict[str, str] = {}
-    hash_to_element_ids: dict[str, list[str]] = {}
+    hash_to_element_ids: defaultdict[str, list[str]] = defaultdict(list)
 
     for element in elements:
         element_id: str = element.get("id", "")
@@ -202,9 +202,9 @@ def build_element_dict(
         id_to_frame_dict[element_id] = element["frame"]
         element_hash = hash_element(element)
         id_to_element_hash[element_id] = element_hash
-        hash_to_element_ids[element_hash] = hash_to_element_ids.get(element_hash, []) + [element_id]
+        hash_to_element_ids[element_hash].append(element_id)
 
-    return id_to_css_dict, id_to_element_dict, id_to_frame_dict, id_to_element_hash, hash_to_element_ids
+    return id_to_css_dict, id_to_element_dict, id_to_frame_dict, id_to_element_hash, dict(hash_to_element_ids)
 
 
 class ElementTreeFormat(StrEnum):
@@ -538,21 +538,27 @@ async def scrape_web_unsafe(
     if not elements:
         raise Exception("No elements found on the page")
 
-    text_content = await get_frame_text(page.main_frame)
+    async def get_html_and_window_dimension() -> tuple[str, Resolution | None]:
+        try:
+            skyvern_frame = await SkyvernFrame.create_instance(frame=page)
+            html = await skyvern_frame.get_content()
+            window_dimension = None
+            if page.viewport_size:
+                window_dimension = Resolution(width=page.viewport_size["width"], height=page.viewport_size["height"])
+            return html, window_dimension
+        except Exception:
+            LOG.error(
+                "Failed out to get HTML content",
+                url=url,
+                exc_info=True,
+            )
+            return "", None
 
-    html = ""
-    window_dimension = None
-    try:
-        skyvern_frame = await SkyvernFrame.create_instance(frame=page)
-        html = await skyvern_frame.get_content()
-        if page.viewport_size:
-            window_dimension = Resolution(width=page.viewport_size["width"], height=page.viewport_size["height"])
-    except Exception:
-        LOG.error(
-            "Failed out to get HTML content",
-            url=url,
-            exc_info=True,
-        )
+    # text extraction and HTML content are independent reads, so run them concurrently
+    text_content, (html, window_dimension) = await asyncio.gather(
+        get_frame_text(page.main_frame),
+        get_html_and_window_dimension(),
+    )
 
     return ScrapedPage(
         elements=elements,
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import copy
 import typing
+from collections import deque
 from enum import StrEnum
 from random import uniform
 from urllib.parse import urlparse
@@ -32,10 +33,25 @@ LOG = structlog.get_logger()
 COMMON_INPUT_TAGS = {"input", "textarea", "select"}
 
 
-async def resolve_locator(scrape_page: ScrapedPage, page: Page, frame: str, css: str) -> tuple[Locator, Page | Frame]:
+async def resolve_locator(
+    scrape_page: ScrapedPage,
+    page: Page,
+    frame: str,
+    css: str,
+    frame_cache: dict[str, tuple[Page | FrameLocator, Page | Frame]] | None = None,
+) -> tuple[Locator, Page | Frame]:
     iframe_path: list[str] = []
 
+    current_page: Page | FrameLocator = page
+    current_frame: Page | Frame = page
+
     while frame != "main.frame":
+        # the frame tree is immutable for the life of a ScrapedPage,
+        # so an already-resolved ancestor chain can be reused as-is
+        if frame_cache is not None and frame in frame_cache:
+            current_page, current_frame = frame_cache[frame]
+            break
+
         iframe_path.append(frame)
 
         frame_element = scrape_page.id_to_element_dict.get(frame)
@@ -48,9 +64,6 @@ async def resolve_locator(scrape_page: ScrapedPage, page: Page, frame: str, css:
 
         frame = parent_frame
 
-    current_page: Page | FrameLocator = page
-    current_frame: Page | Frame = page
-
     while len(iframe_path) > 0:
         child_frame = iframe_path.pop()
 
@@ -65,6 +78,9 @@ async def resolve_locator(scrape_page: ScrapedPage, page: Page, frame: str, css:
 
         current_page = current_page.frame_locator(f"[{SKYVERN_ID_ATTR}='{child_frame}']")
 
+        if frame_cache is not None:
+            frame_cache[child_frame] = (current_page, current_frame)
+
     return current_page.locator(css), current_frame
 
 
@@ -75,9 +91,9 @@ class InteractiveElement(StrEnum):
     BUTTON = "button"
 
 
-SELECTABLE_ELEMENT = [InteractiveElement.INPUT, InteractiveElement.SELECT]
-RAW_INPUT_TYPE_VALUE = ["number", "url", "tel", "email", "username", "password"]
-RAW_INPUT_NAME_VALUE = ["name", "email", "username", "password", "phone"]
+SELECTABLE_ELEMENT = frozenset({InteractiveElement.INPUT, InteractiveElement.SELECT})
+RAW_INPUT_TYPE_VALUE = frozenset({"number", "url", "tel", "email", "username", "password"})
+RAW_INPUT_NAME_VALUE = frozenset({"name", "email", "username", "password", "phone"})
 
 
 class SkyvernOptionType(typing.TypedDict):
@@ -251,8 +267,11 @@ class SkyvernElement:
 
         mode: typing.Literal["auto", "dynamic"] = "dynamic" if dynamic else "auto"
         try:
-            disabled_attr = await self.get_attr("disabled", mode=mode)
-            aria_disabled_attr = await self.get_attr("aria-disabled", mode=mode)
+            # both attribute reads may round-trip through playwright, so issue them together
+            disabled_attr, aria_disabled_attr = await asyncio.gather(
+                self.get_attr("disabled", mode=mode),
+                self.get_attr("aria-disabled", mode=mode),
+            )
             skyvern_frame = await SkyvernFrame.create_instance(self.get_frame())
             style_disabled = await skyvern_frame.get_disabled_from_style(await self.get_element_handler())
 
@@ -281,7 +300,8 @@ class SkyvernElement:
         return disabled or aria_disabled or style_disabled
 
     async def is_selectable(self) -> bool:
-        return await self.get_selectable() or self.get_tag_name() in SELECTABLE_ELEMENT
+        # cheap cached tag check first, so most <input>/<select> elements skip the attribute probe
+        return self.get_tag_name() in SELECTABLE_ELEMENT or await self.get_selectable()
 
     async def is_visible(self, must_visible_style: bool = True) -> bool:
         if not await self.get_locator().count():
@@ -384,7 +404,7 @@ class SkyvernElement:
         if not blocking_element_id:
             return None, blocked
 
-        if await dom.check_id_in_dom(blocking_element_id):
+        if dom.check_id_in_dom(blocking_element_id):
             return await dom.get_skyvern_element_by_id(blocking_element_id), blocked
 
         if incremental_page and incremental_page.check_id_in_page(blocking_element_id):
@@ -491,11 +511,7 @@ class SkyvernElement:
             return parent_locator
 
     async def find_selectable_child(self, dom: DomUtil) -> SkyvernElement | None:
-        # BFS to find the first selectable child
-        index = 0
-        queue = [self]
-        while index < len(queue):
-            item = queue[index]
+        async def check_item(item: SkyvernElement) -> SkyvernElement | None:
             if item.is_interactable() and await item.is_selectable():
                 return item
 
@@ -509,25 +525,44 @@ class SkyvernElement:
                     element=item.__static_element,
                     exc_info=True,
                 )
+            return None
 
-            children: list[dict] = item.__static_element.get("children", [])
-            for child in children:
-                child_id = child.get("id", "")
-                child_element = await dom.get_skyvern_element_by_id(child_id)
-                queue.append(child_element)
-
-            index += 1
+        # BFS to find the first selectable child.
+        # each level is checked and expanded concurrently, so the wall time scales
+        # with the tree depth instead of the node count
+        frontier = [self]
+        visited = {self.get_id()}
+        while frontier:
+            for found in await asyncio.gather(*[check_item(item) for item in frontier]):
+                if found is not None:
+                    # the caller interacts with the match, so re-resolve it with validation
+                    # to keep the xpath fallback when the css selector no longer matches
+                    return await dom.get_skyvern_element_by_id(found.get_id())
+
+            child_ids: list[str] = []
+            for item in frontier:
+                for child in item.__static_element.get("children", []):
+                    child_id = child.get("id", "")
+                    if not child_id or child_id in visited:
+                        continue
+                    visited.add(child_id)
+                    child_ids.append(child_id)
+            frontier = list(
+                await asyncio.gather(
+                    *[dom.get_skyvern_element_by_id(child_id, validate=False) for child_id in child_ids]
+                )
+            )
         return None
 
     async def find_interactable_anchor_child(
         self, dom: DomUtil, element_type: InteractiveElement
     ) -> SkyvernElement | None:
-        index = 0
-        queue = [self]
-        while index < len(queue):
-            item = queue[index]
+        visited = {self.get_id()}
+        queue = deque([self])
+        while queue:
+            item = queue.popleft()
             if item.is_interactable() and item.get_tag_name() == element_type:
-                return item
+                return await dom.get_skyvern_element_by_id(item.get_id())
 
             try:
                 for_element = await item.find_label_for(dom=dom)
@@ -543,10 +578,11 @@ class SkyvernElement:
             children: list[dict] = item.__static_element.get("children", [])
             for child in children:
                 child_id = child.get("id", "")
-                child_element = await dom.get_skyvern_element_by_id(child_id)
-                queue.append(child_element)
+                if not child_id or child_id in visited:
+                    continue
+                visited.add(child_id)
+                queue.append(await dom.get_skyvern_element_by_id(child_id, validate=False))
 
-            index += 1
         return None
 
     async def get_attr(
@@ -814,14 +850,22 @@ class DomUtil:
     def __init__(self, scraped_page: ScrapedPage, page: Page) -> None:
         self.scraped_page = scraped_page
         self.page = page
+        self._frame_cache: dict[str, tuple[Page | FrameLocator, Page | Frame]] = {}
+        self._element_cache: dict[str, SkyvernElement] = {}
 
-    async def check_id_in_dom(self, element_id: str) -> bool:
+    def check_id_in_dom(self, element_id: str) -> bool:
         css_selector = self.scraped_page.id_to_css_dict.get(element_id, "")
         if css_selector:
             return True
         return False
 
-    async def get_skyvern_element_by_id(self, element_id: str) -> SkyvernElement:
+    async def get_skyvern_element_by_id(self, element_id: str, validate: bool = True) -> SkyvernElement:
+        # the scraped page is immutable for the life of this DomUtil,
+        # so an element only needs to be resolved and validated once
+        cached_element = self._element_cache.get(element_id)
+        if cached_element is not None:
+            return cached_element
+
         element = self.scraped_page.id_to_element_dict.get(element_id)
         if not element:
             raise MissingElementDict(element_id)
@@ -834,34 +878,45 @@ class DomUtil:
         if not css:
             raise MissingElementInCSSMap(element_id)
 
-        locator, frame_content = await resolve_locator(self.scraped_page, self.page, frame, css)
-
-        num_elements = await locator.count()
-        if num_elements < 1:
-            xpath: str | None = element.get("xpath")
-            if not xpath:
-                LOG.warning("No elements found with css. Validation failed.", css=css, element_id=element_id)
-                raise MissingElement(selector=css, element_id=element_id)
-            else:
-                # WARNING: current xpath is based on the tag name.
-                # It can only represent the element possition in the DOM tree with tag name, it's not 100% reliable.
-                # As long as the current possition has the same element with the tag name, the locator can be found.
-                # (maybe) we should validate the element hash to make sure the element is the same?
-                LOG.warning("Fallback to locator element by xpath.", xpath=xpath, element_id=element_id)
-                locator = frame_content.locator(f"xpath={xpath}")
-                num_elements = await locator.count()
-                if num_elements < 1:
-                    raise MissingElement(selector=xpath, element_id=element_id)
+        locator, frame_content = await resolve_locator(
+            self.scraped_page, self.page, frame, css, frame_cache=self._frame_cache
+        )
 
-        elif num_elements > 1:
-            LOG.warning(
-                "Multiple elements found with css. Expected 1. Validation failed.",
-                num_elements=num_elements,
-                selector=css,
-                element_id=element_id,
-            )
-            raise MultipleElementsFound(num=num_elements, selector=css, element_id=element_id)
+        # the css selectors are derived from the unique skyvern id attribute, so uniqueness
+        # normally holds by construction. traversal-heavy callers skip the count() round-trip
+        # with validate=False while probing static element data, then re-resolve the match
+        # they return with validation so interactions keep the xpath fallback below.
+        if validate:
+            num_elements = await locator.count()
+            if num_elements < 1:
+                xpath: str | None = element.get("xpath")
+                if not xpath:
+                    LOG.warning("No elements found with css. Validation failed.", css=css, element_id=element_id)
+                    raise MissingElement(selector=css, element_id=element_id)
+                else:
+                    # WARNING: current xpath is based on the tag name.
+                    # It can only represent the element possition in the DOM tree with tag name, it's not 100% reliable.
+                    # As long as the current possition has the same element with the tag name, the locator can be found.
+                    # (maybe) we should validate the element hash to make sure the element is the same?
+                    LOG.warning("Fallback to locator element by xpath.", xpath=xpath, element_id=element_id)
+                    locator = frame_content.locator(f"xpath={xpath}")
+                    num_elements = await locator.count()
+                    if num_elements < 1:
+                        raise MissingElement(selector=xpath, element_id=element_id)
+
+            elif num_elements > 1:
+                LOG.warning(
+                    "Multiple elements found with css. Expected 1. Validation failed.",
+                    num_elements=num_elements,
+                    selector=css,
+                    element_id=element_id,
+                )
+                raise MultipleElementsFound(num=num_elements, selector=css, element_id=element_id)
 
         hash_value = self.scraped_page.id_to_element_hash.get(element_id, "")
 
-        return SkyvernElement(locator, frame_content, element, hash_value)
+        skyvern_element = SkyvernElement(locator, frame_content, element, hash_value)
+        # only cache validated elements so a later validate=True lookup never gets an unchecked locator
+        if validate:
+            self._element_cache[element_id] = skyvern_element
+        return skyvern_element
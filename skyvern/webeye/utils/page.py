@@ -248,7 +248,13 @@ class SkyvernFrame:
     @classmethod
     async def create_instance(cls, frame: Page | Frame) -> SkyvernFrame:
         instance = cls(frame=frame)
-        await cls.evaluate(frame=instance.frame, expression=JS_FUNCTION_DEFS)
+        # the function definitions survive in the frame until it navigates, so probe for
+        # one of them before shipping the whole domUtils.js script for V8 to re-parse
+        installed = await cls.evaluate(
+            frame=instance.frame, expression="() => typeof getBlockElementUniqueID === 'function'"
+        )
+        if not installed:
+            await cls.evaluate(frame=instance.frame, expression=JS_FUNCTION_DEFS)
         return instance
 
     def __init__(self, frame: Page | Frame) -> None: